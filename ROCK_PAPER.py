@@ -9,10 +9,19 @@ Features:
 - Play again/reset functionality
 """
 
+from functools import partial
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 import random
 
+CODES = {"rock": 0, "paper": 1, "scissors": 2}
+NAMES = ("Rock", "Paper", "Scissors")
+TIE, WIN, LOSE = "It's a Tie!", "You Win! 🎉", "Computer Wins! 🤖"
+# Indexed by (user - computer) % 3: each choice beats the one before it
+OUTCOMES = (TIE, WIN, LOSE)
+BG = "#f5f5f5"
+
 # -----------------------------
 # Main Game Class
 # -----------------------------
@@ -21,39 +30,55 @@ class RockPaperScissors:
         self.root = root
         self.root.title("Rock-Paper-Scissors Game")
         self.root.geometry("500x400")
-        self.root.config(bg="#f5f5f5")
+        self.root.config(bg=BG)
+
+        # Shared fonts: one Tcl font object each instead of one per widget
+        self.head_font = tkfont.Font(family="Helvetica", size=20, weight="bold")
+        self.result_font = tkfont.Font(family="Helvetica", size=16)
+        self.choice_font = tkfont.Font(family="Helvetica", size=14)
+        self.body_font = tkfont.Font(family="Helvetica", size=12)
 
         # Scores
         self.user_score = 0
         self.computer_score = 0
 
+        # Private RNG with its randrange bound once for the click path
+        self._rng = random.Random()
+        self._randrange = self._rng.randrange
+
+        # All nine result messages, keyed by (user, computer) codes
+        self._messages = {
+            (u, c): f"You: {NAMES[u]} | Computer: {NAMES[c]}\n{OUTCOMES[(u - c) % 3]}"
+            for u in range(3) for c in range(3)
+        }
+
         # Heading
         self.heading = tk.Label(
             root, text="Rock-Paper-Scissors",
-            font=("Helvetica", 20, "bold"),
-            bg="#f5f5f5", fg="#333"
+            font=self.head_font,
+            bg=BG, fg="#333"
         )
         self.heading.pack(pady=10)
 
         # Frame for buttons
-        self.button_frame = tk.Frame(root, bg="#f5f5f5")
+        self.button_frame = tk.Frame(root, bg=BG)
         self.button_frame.pack(pady=20)
 
         # Choices buttons
         self.rock_btn = tk.Button(
-            self.button_frame, text="Rock 🪨", width=10,
-            command=lambda: self.play("rock"),
-            font=("Helvetica", 14), bg="#dfe6e9"
+            self.button_frame, text="Rock", width=10,
+            command=partial(self.play, "rock"),
+            font=self.choice_font, bg="#dfe6e9"
         )
         self.paper_btn = tk.Button(
-            self.button_frame, text="Paper 📄", width=10,
-            command=lambda: self.play("paper"),
-            font=("Helvetica", 14), bg="#dfe6e9"
+            self.button_frame, text="Paper", width=10,
+            command=partial(self.play, "paper"),
+            font=self.choice_font, bg="#dfe6e9"
         )
         self.scissors_btn = tk.Button(
-            self.button_frame, text="Scissors ✂️", width=10,
-            command=lambda: self.play("scissors"),
-            font=("Helvetica", 14), bg="#dfe6e9"
+            self.button_frame, text="Scissors", width=10,
+            command=partial(self.play, "scissors"),
+            font=self.choice_font, bg="#dfe6e9"
         )
 
         self.rock_btn.grid(row=0, column=0, padx=10)
@@ -63,7 +88,7 @@ class RockPaperScissors:
         # Result Display
         self.result_label = tk.Label(
             root, text="Make your choice!",
-            font=("Helvetica", 16), bg="#f5f5f5", fg="#2d3436"
+            font=self.result_font, bg=BG, fg="#2d3436"
         )
         self.result_label.pack(pady=20)
 
@@ -71,14 +96,14 @@ class RockPaperScissors:
         self.score_label = tk.Label(
             root,
             text=f"User: {self.user_score}  |  Computer: {self.computer_score}",
-            font=("Helvetica", 14), bg="#f5f5f5", fg="#0984e3"
+            font=self.choice_font, bg=BG, fg="#0984e3"
         )
         self.score_label.pack(pady=10)
 
         # Reset Button
         self.reset_btn = tk.Button(
             root, text="Reset Game", command=self.reset_game,
-            font=("Helvetica", 12), bg="#fab1a0"
+            font=self.body_font, bg="#fab1a0"
         )
         self.reset_btn.pack(pady=15)
 
@@ -86,25 +111,18 @@ class RockPaperScissors:
     # Game Logic
     # -----------------------------
     def play(self, user_choice):
-        choices = ["rock", "paper", "scissors"]
-        computer_choice = random.choice(choices)
+        u = CODES[user_choice]
+        c = self._randrange(3)
 
         # Determine result
-        if user_choice == computer_choice:
-            result = "It's a Tie!"
-        elif (user_choice == "rock" and computer_choice == "scissors") or \
-             (user_choice == "scissors" and computer_choice == "paper") or \
-             (user_choice == "paper" and computer_choice == "rock"):
-            result = "You Win! 🎉"
+        diff = (u - c) % 3
+        if diff == 1:
             self.user_score += 1
-        else:
-            result = "Computer Wins! 🤖"
+        elif diff == 2:
             self.computer_score += 1
 
         # Update result display
-        self.result_label.config(
-            text=f"You: {user_choice.capitalize()} | Computer: {computer_choice.capitalize()}\n{result}"
-        )
+        self.result_label.config(text=self._messages[(u, c)])
 
         # Update score display
         self.score_label.config(
@@ -4,19 +4,34 @@ Contact Management System — Internship Project
 Features:
 - SQLite database for permanent storage
 - Add, View, Search, Update, Delete contacts
+- Bulk import from CSV (name, phone, email, address)
 - Tkinter GUI with modern design
 """
 
+import csv
+import queue
 import sqlite3
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
+import tkinter.font as tkfont
+from tkinter import ttk, messagebox, filedialog
+
+DB_PATH = "contacts.db"
+BG = "#f5f6fa"
+# UPDATE ... RETURNING needs SQLite 3.35+
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 # -----------------------------
 # Database Setup
 # -----------------------------
-def init_db():
-    conn = sqlite3.connect("contacts.db")
+def init_db(conn):
     cur = conn.cursor()
+    # WAL + relaxed sync: one fsync per checkpoint instead of per commit
+    cur.execute("PRAGMA journal_mode=WAL;")
+    cur.execute("PRAGMA synchronous=NORMAL;")
+    cur.execute("PRAGMA busy_timeout=5000;")
+    cur.execute("PRAGMA temp_store=MEMORY;")
+    cur.execute("PRAGMA cache_size=-20000;")
     cur.execute('''CREATE TABLE IF NOT EXISTS contacts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
@@ -24,59 +39,117 @@ def init_db():
                     email TEXT,
                     address TEXT
                 )''')
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts(name COLLATE NOCASE)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts(phone)")
+    has_fts = init_fts(cur)
     conn.commit()
-    conn.close()
+    return has_fts
+
+def init_fts(cur):
+    """Create the FTS5 index over name/phone; False if SQLite lacks FTS5."""
+    exists = cur.execute("SELECT 1 FROM sqlite_master WHERE name='contacts_fts'").fetchone()
+    try:
+        cur.execute("CREATE VIRTUAL TABLE IF NOT EXISTS contacts_fts USING fts5("
+                    "name, phone, content='contacts', content_rowid='id')")
+    except sqlite3.OperationalError:
+        return False
+    # Keep the external-content index in sync with the contacts table
+    cur.execute('''CREATE TRIGGER IF NOT EXISTS contacts_ai AFTER INSERT ON contacts BEGIN
+                    INSERT INTO contacts_fts(rowid, name, phone) VALUES (new.id, new.name, new.phone);
+                END''')
+    cur.execute('''CREATE TRIGGER IF NOT EXISTS contacts_ad AFTER DELETE ON contacts BEGIN
+                    INSERT INTO contacts_fts(contacts_fts, rowid, name, phone) VALUES ('delete', old.id, old.name, old.phone);
+                END''')
+    cur.execute('''CREATE TRIGGER IF NOT EXISTS contacts_au AFTER UPDATE ON contacts BEGIN
+                    INSERT INTO contacts_fts(contacts_fts, rowid, name, phone) VALUES ('delete', old.id, old.name, old.phone);
+                    INSERT INTO contacts_fts(rowid, name, phone) VALUES (new.id, new.name, new.phone);
+                END''')
+    if not exists:
+        # Index contacts saved before the FTS table existed
+        cur.execute("INSERT INTO contacts_fts(contacts_fts) VALUES ('rebuild')")
+    return True
+
+def fts_query(keyword):
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in keyword.split())
 
 # -----------------------------
 # Main Application Class
 # -----------------------------
 class ContactApp:
+    # Fixed SQL text so repeat calls hit the connection's statement cache
+    _SQL_INSERT = "INSERT INTO contacts (name, phone, email, address) VALUES (?, ?, ?, ?)"
+    _SQL_UPDATE = "UPDATE contacts SET name=?, phone=?, email=?, address=? WHERE id=?"
+    _SQL_UPDATE_RETURNING = _SQL_UPDATE + " RETURNING *"
+    _SQL_DELETE = "DELETE FROM contacts WHERE id=?"
+    _SQL_SELECT_ALL = "SELECT * FROM contacts"
+    _SQL_SEARCH = "SELECT * FROM contacts WHERE name LIKE ? OR phone GLOB ?"
+    _SQL_SEARCH_FTS = ("SELECT c.* FROM contacts c JOIN contacts_fts f ON f.rowid = c.id "
+                       "WHERE contacts_fts MATCH ? ORDER BY c.id")
+
     def __init__(self, root):
         self.root = root
         self.root.title("📒 Contact Management System")
         self.root.geometry("750x500")
-        self.root.config(bg="#f5f6fa")
+        self.root.config(bg=BG)
+
+        # Shared fonts: one Tcl font object each instead of one per widget
+        self.body_font = tkfont.Font(family="Helvetica", size=12)
+        self.head_font = tkfont.Font(family="Helvetica", size=20, weight="bold")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Single connection reused for every query
+        self.conn = sqlite3.connect(DB_PATH, check_same_thread=False,
+                                    cached_statements=256, isolation_level=None)
+        self.has_fts = init_db(self.conn)
+
+        # Reads run on a worker thread; results come back through _db_results
+        self._db_queue = queue.Queue()
+        self._db_results = queue.Queue()
+        self._db_pending = 0    # jobs submitted whose results haven't been handled
+        self._db_thread = threading.Thread(target=self._db_worker, daemon=True)
+        self._db_thread.start()
 
         # Title
         title = tk.Label(root, text="Contact Management System",
-                         font=("Helvetica", 20, "bold"), bg="#f5f6fa", fg="#2d3436")
+                         font=self.head_font, bg=BG, fg="#2d3436")
         title.pack(pady=10)
 
         # Form Frame
-        form_frame = tk.Frame(root, bg="#f5f6fa")
+        form_frame = tk.Frame(root, bg=BG)
         form_frame.pack(pady=5)
 
-        tk.Label(form_frame, text="Name:", font=("Helvetica", 12), bg="#f5f6fa").grid(row=0, column=0, sticky="w", padx=10, pady=5)
-        tk.Label(form_frame, text="Phone:", font=("Helvetica", 12), bg="#f5f6fa").grid(row=1, column=0, sticky="w", padx=10, pady=5)
-        tk.Label(form_frame, text="Email:", font=("Helvetica", 12), bg="#f5f6fa").grid(row=2, column=0, sticky="w", padx=10, pady=5)
-        tk.Label(form_frame, text="Address:", font=("Helvetica", 12), bg="#f5f6fa").grid(row=3, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(form_frame, text="Name:", font=self.body_font, bg=BG).grid(row=0, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(form_frame, text="Phone:", font=self.body_font, bg=BG).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(form_frame, text="Email:", font=self.body_font, bg=BG).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(form_frame, text="Address:", font=self.body_font, bg=BG).grid(row=3, column=0, sticky="w", padx=10, pady=5)
 
-        self.name_var = tk.StringVar()
-        self.phone_var = tk.StringVar()
-        self.email_var = tk.StringVar()
-        self.address_var = tk.StringVar()
+        self.name_entry = tk.Entry(form_frame, width=40)
+        self.phone_entry = tk.Entry(form_frame, width=40)
+        self.email_entry = tk.Entry(form_frame, width=40)
+        self.address_entry = tk.Entry(form_frame, width=40)
+        self.entries = (self.name_entry, self.phone_entry, self.email_entry, self.address_entry)
 
-        tk.Entry(form_frame, textvariable=self.name_var, width=40).grid(row=0, column=1, padx=10, pady=5)
-        tk.Entry(form_frame, textvariable=self.phone_var, width=40).grid(row=1, column=1, padx=10, pady=5)
-        tk.Entry(form_frame, textvariable=self.email_var, width=40).grid(row=2, column=1, padx=10, pady=5)
-        tk.Entry(form_frame, textvariable=self.address_var, width=40).grid(row=3, column=1, padx=10, pady=5)
+        for row, entry in enumerate(self.entries):
+            entry.grid(row=row, column=1, padx=10, pady=5)
 
         # Buttons
-        btn_frame = tk.Frame(root, bg="#f5f6fa")
+        btn_frame = tk.Frame(root, bg=BG)
         btn_frame.pack(pady=10)
 
         tk.Button(btn_frame, text="Add Contact", width=15, command=self.add_contact, bg="#00b894", fg="white").grid(row=0, column=0, padx=5)
         tk.Button(btn_frame, text="Update Contact", width=15, command=self.update_contact, bg="#0984e3", fg="white").grid(row=0, column=1, padx=5)
         tk.Button(btn_frame, text="Delete Contact", width=15, command=self.delete_contact, bg="#d63031", fg="white").grid(row=0, column=2, padx=5)
         tk.Button(btn_frame, text="Clear Fields", width=15, command=self.clear_fields, bg="#636e72", fg="white").grid(row=0, column=3, padx=5)
+        tk.Button(btn_frame, text="Import CSV", width=15, command=self.import_csv, bg="#fdcb6e", fg="white").grid(row=0, column=4, padx=5)
 
         # Search
-        search_frame = tk.Frame(root, bg="#f5f6fa")
+        search_frame = tk.Frame(root, bg=BG)
         search_frame.pack(pady=5)
 
-        tk.Label(search_frame, text="Search by Name/Phone:", font=("Helvetica", 12), bg="#f5f6fa").grid(row=0, column=0, padx=10)
-        self.search_var = tk.StringVar()
-        tk.Entry(search_frame, textvariable=self.search_var, width=30).grid(row=0, column=1, padx=10)
+        tk.Label(search_frame, text="Search by Name/Phone:", font=self.body_font, bg=BG).grid(row=0, column=0, padx=10)
+        self.search_entry = tk.Entry(search_frame, width=30)
+        self.search_entry.grid(row=0, column=1, padx=10)
         tk.Button(search_frame, text="Search", command=self.search_contact, bg="#6c5ce7", fg="white").grid(row=0, column=2, padx=5)
         tk.Button(search_frame, text="Show All", command=self.load_contacts, bg="#2d3436", fg="white").grid(row=0, column=3, padx=5)
 
@@ -104,59 +177,125 @@ class ContactApp:
     # Functions
     # -----------------------------
     def run_query(self, query, params=()):
-        conn = sqlite3.connect("contacts.db")
-        cur = conn.cursor()
-        cur.execute(query, params)
-        conn.commit()
-        conn.close()
+        # Autocommit connection: a single statement commits on its own
+        self.conn.execute(query, params)
 
     def fetch_query(self, query, params=()):
-        conn = sqlite3.connect("contacts.db")
-        cur = conn.cursor()
-        cur.execute(query, params)
-        rows = cur.fetchall()
+        return self.conn.execute(query, params).fetchall()
+
+    def submit_query(self, query, params, callback):
+        # Poll only while something is outstanding, so an idle window stays idle
+        if self._db_pending == 0:
+            self.root.after(20, self._poll_db_results)
+        self._db_pending += 1
+        self._db_queue.put((query, params, callback))
+
+    def _db_worker(self):
+        # Own connection: WAL lets these reads run alongside UI-thread writes
+        conn = sqlite3.connect(DB_PATH, cached_statements=256, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout=5000;")
+        while True:
+            job = self._db_queue.get()
+            if job is None:
+                break
+            query, params, callback = job
+            try:
+                rows = conn.execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                self._db_results.put((self._show_db_error, e))
+                continue
+            self._db_results.put((callback, rows))
         conn.close()
-        return rows
+
+    def _show_db_error(self, error):
+        messagebox.showerror("Database Error", str(error))
+
+    def _poll_db_results(self):
+        # Tk is not thread-safe, so callbacks are run here on the main loop
+        try:
+            while True:
+                callback, rows = self._db_results.get_nowait()
+                self._db_pending -= 1
+                callback(rows)
+        except queue.Empty:
+            pass
+        finally:
+            # Keep polling even if a callback raised, or later reads never show
+            if self._db_pending > 0:
+                self.root.after(20, self._poll_db_results)
 
     def add_contact(self):
-        name, phone, email, address = self.name_var.get(), self.phone_var.get(), self.email_var.get(), self.address_var.get()
+        name, phone, email, address = (entry.get() for entry in self.entries)
         if name == "" or phone == "":
             messagebox.showwarning("Input Error", "Name and Phone are required!")
             return
-        self.run_query("INSERT INTO contacts (name, phone, email, address) VALUES (?, ?, ?, ?)",
-                       (name, phone, email, address))
+        self.run_query(self._SQL_INSERT, (name, phone, email, address))
         messagebox.showinfo("Success", "Contact added successfully!")
         self.load_contacts()
         self.clear_fields()
 
-    def load_contacts(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        rows = self.fetch_query("SELECT * FROM contacts")
+    def add_contacts_bulk(self, rows):
+        # One transaction for the whole batch instead of one per row
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(self._SQL_INSERT, rows)
+
+    def import_csv(self):
+        path = filedialog.askopenfilename(title="Import Contacts", filetypes=[("CSV files", "*.csv")])
+        if not path:
+            return
+        rows = []
+        try:
+            # utf-8-sig strips the BOM Excel writes at the start of "CSV UTF-8"
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                for rec in csv.reader(f):
+                    rec = [field.strip() for field in rec[:4]] + [""] * (4 - len(rec))
+                    name, phone = rec[0], rec[1]
+                    if name == "" or phone == "" or (name.lower(), phone.lower()) == ("name", "phone"):
+                        continue
+                    rows.append(tuple(rec))
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            messagebox.showerror("Import Error", f"Could not read {path}:\n{e}")
+            return
+        if not rows:
+            messagebox.showwarning("Import Error", "No contacts with a name and phone found!")
+            return
+        self.add_contacts_bulk(rows)
+        messagebox.showinfo("Success", f"Imported {len(rows)} contacts!")
+        self.load_contacts()
+
+    def show_rows(self, rows):
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        # Raw Tcl insert skips Treeview.insert's per-row option handling
+        insert = self.tree.tk.call
+        tree_path = str(self.tree)
         for row in rows:
-            self.tree.insert("", "end", values=row)
+            insert(tree_path, "insert", "", "end", "-values", row)
+
+    def load_contacts(self):
+        self.submit_query(self._SQL_SELECT_ALL, (), self.show_rows)
 
     def search_contact(self):
-        keyword = self.search_var.get()
+        keyword = self.search_entry.get().strip()
         if keyword == "":
             messagebox.showwarning("Input Error", "Enter a name or phone to search!")
             return
-        rows = self.fetch_query("SELECT * FROM contacts WHERE name LIKE ? OR phone LIKE ?", 
-                                ('%' + keyword + '%', '%' + keyword + '%'))
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        for row in rows:
-            self.tree.insert("", "end", values=row)
+        if self.has_fts:
+            self.submit_query(self._SQL_SEARCH_FTS, (fts_query(keyword),), self.show_rows)
+        else:
+            # Prefix matches so both lookups can seek their index
+            self.submit_query(self._SQL_SEARCH, (keyword + '%', keyword + '*'), self.show_rows)
 
     def fill_fields_from_selection(self, event):
         selected = self.tree.focus()
         if not selected:
             return
         values = self.tree.item(selected, "values")
-        self.name_var.set(values[1])
-        self.phone_var.set(values[2])
-        self.email_var.set(values[3])
-        self.address_var.set(values[4])
+        self.clear_fields()
+        for entry, value in zip(self.entries, values[1:]):
+            entry.insert(0, value)
 
     def update_contact(self):
         selected = self.tree.focus()
@@ -166,11 +305,19 @@ class ContactApp:
         values = self.tree.item(selected, "values")
         contact_id = values[0]
 
-        name, phone, email, address = self.name_var.get(), self.phone_var.get(), self.email_var.get(), self.address_var.get()
-        self.run_query("UPDATE contacts SET name=?, phone=?, email=?, address=? WHERE id=?",
-                       (name, phone, email, address, contact_id))
+        name, phone, email, address = (entry.get() for entry in self.entries)
+        params = (name, phone, email, address, contact_id)
+        # Patch just the edited row instead of reloading the whole table
+        if HAS_RETURNING:
+            rows = self.fetch_query(self._SQL_UPDATE_RETURNING, params)
+        else:
+            self.run_query(self._SQL_UPDATE, params)
+            rows = [(contact_id, name, phone, email, address)]
         messagebox.showinfo("Success", "Contact updated successfully!")
-        self.load_contacts()
+        if rows:
+            self.tree.item(selected, values=rows[0])
+        else:
+            self.load_contacts()
         self.clear_fields()
 
     def delete_contact(self):
@@ -182,22 +329,25 @@ class ContactApp:
         contact_id = values[0]
         confirm = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {values[1]}?")
         if confirm:
-            self.run_query("DELETE FROM contacts WHERE id=?", (contact_id,))
+            self.run_query(self._SQL_DELETE, (contact_id,))
             messagebox.showinfo("Deleted", "Contact deleted successfully!")
-            self.load_contacts()
+            self.tree.delete(selected)
             self.clear_fields()
 
     def clear_fields(self):
-        self.name_var.set("")
-        self.phone_var.set("")
-        self.email_var.set("")
-        self.address_var.set("")
+        for entry in self.entries:
+            entry.delete(0, "end")
+
+    def _on_close(self):
+        self._db_queue.put(None)
+        self._db_thread.join(timeout=1)
+        self.conn.close()
+        self.root.destroy()
 
 # -----------------------------
 # Run the App
 # -----------------------------
 if __name__ == "__main__":
-    init_db()
     root = tk.Tk()
     app = ContactApp(root)
     root.mainloop()
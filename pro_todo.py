@@ -8,23 +8,35 @@ Features:
 - Search, filters (priority/status), live refresh
 - Keyboard shortcuts: Ctrl+N (new), Ctrl+E (edit), Ctrl+D (toggle done), Ctrl+F (focus search), Delete (remove)
 - Right-click context menu
+- Multi-select (Ctrl/Shift+click) to toggle or delete several tasks at once
 - Undo last delete
-- JSON import/export (no third-party libs)
+- JSON import/export (stdlib json; orjson/ujson used automatically if installed)
 """
 
-import json
 import os
 import sqlite3
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 
+# Fastest available JSON codec; all three accept bytes in loads()
+try:
+    import orjson as _json
+except ImportError:
+    try:
+        import ujson as _json
+    except ImportError:
+        import json as _json
+
 DB_PATH = Path("todo_pro.sqlite3")
+ROW_HEIGHT = 26     # Treeview rowheight; also sizes the virtual scroll window
+OPTIMIZE_INTERVAL_MS = 15 * 60 * 1000
 
 # ---------- Domain model ----------
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int | None
     title: str
@@ -36,9 +48,22 @@ class Task:
     updated_at: str
 
 PRIORITIES = ["High", "Medium", "Low"]
+PRIORITY_RANK = {"High": 1, "Medium": 2, "Low": 3}
+# Columns in Task field order, so rows construct positionally: Task(*row)
+# (the table also stores priority_rank for sorting)
+TASK_COLUMNS = "id, title, notes, priority, due_date, done, created_at, updated_at"
+# Smart order: High->Med->Low, due date NULLs last, then created_at
+# (same terms as idx_tasks_prio_due, so SQLite walks the index)
+SMART_ORDER = """
+        ORDER BY
+          priority_rank,
+          (due_date IS NULL OR due_date = ''),
+          due_date ASC,
+          created_at ASC
+"""
 
 def iso_now() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
 
 def valid_date_or_none(s: str | None) -> str | None:
     if not s:
@@ -47,18 +72,61 @@ def valid_date_or_none(s: str | None) -> str | None:
     if not s:
         return None
     try:
-        datetime.strptime(s, "%Y-%m-%d")
+        # Fast path for the canonical shape; anything else goes through strptime
+        if (len(s) == 10 and s[4] == "-" and s[7] == "-"
+                and s[:4].isdigit() and s[5:7].isdigit() and s[8:].isdigit()):
+            date(int(s[:4]), int(s[5:7]), int(s[8:]))
+        else:
+            datetime.strptime(s, "%Y-%m-%d")
         return s
     except ValueError:
         raise ValueError("Date must be in YYYY-MM-DD format.")
 
+def _dump_json(obj) -> bytes:
+    if _json.__name__ == "orjson":
+        return _json.dumps(obj, option=_json.OPT_INDENT_2)
+    return _json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+def fts_query(q: str) -> str:
+    # Every word must match as a token prefix; quoting neutralizes FTS syntax
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in q.split())
+
 # ---------- Repository layer ----------
+# SQL built once at import; methods only bind arguments
+SQL_INSERT = (
+    "INSERT INTO tasks(title,notes,priority,priority_rank,due_date,done,created_at,updated_at) "
+    "VALUES (?,?,?,?,?,0,?,?)"
+)
+SQL_UPDATE = "UPDATE tasks SET title=?, notes=?, priority=?, priority_rank=?, due_date=?, updated_at=? WHERE id=?"
+SQL_TOGGLE_DONE = "UPDATE tasks SET done = CASE done WHEN 1 THEN 0 ELSE 1 END, updated_at=? WHERE id=?"
+SQL_DELETE = "DELETE FROM tasks WHERE id=?"
+SQL_GET = f"SELECT {TASK_COLUMNS} FROM tasks WHERE id=?"
+SQL_SELECT = f"SELECT {TASK_COLUMNS} FROM tasks"
+
 class TaskRepo:
     def __init__(self, path: Path):
-        self.conn = sqlite3.connect(path)
+        self.conn = sqlite3.connect(path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON;")
+        if str(path) != ":memory:":
+            # WAL: readers don't block the writer, commits skip the journal fsync
+            self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.execute("PRAGMA temp_store = MEMORY;")
+        self.conn.execute("PRAGMA cache_size = -20000;")      # ~20 MB
+        self.conn.execute("PRAGMA mmap_size = 268435456;")    # 256 MB
         self._migrate()
+        self._where = self._build_where_shapes()
+        self._list_sql = {shape: f"{SQL_SELECT} {where} {SMART_ORDER}" for shape, where in self._where.items()}
+
+    def optimize(self):
+        # Cheap when nothing changed; refreshes planner stats for the indexes
+        self.conn.execute("PRAGMA optimize;")
+
+    def close(self):
+        # Let SQLite refresh planner stats before the connection goes away
+        self.optimize()
+        self.conn.close()
 
     def _migrate(self):
         self.conn.execute("""
@@ -67,6 +135,7 @@ class TaskRepo:
                 title TEXT NOT NULL,
                 notes TEXT NOT NULL DEFAULT '',
                 priority TEXT NOT NULL CHECK (priority IN ('High','Medium','Low')) DEFAULT 'Medium',
+                priority_rank INTEGER NOT NULL DEFAULT 2,
                 due_date TEXT,
                 done INTEGER NOT NULL DEFAULT 0 CHECK (done IN (0,1)),
                 created_at TEXT NOT NULL,
@@ -87,94 +156,184 @@ class TaskRepo:
             self.conn.execute("ALTER TABLE tasks ADD COLUMN created_at TEXT NOT NULL DEFAULT '';")
         if "updated_at" not in cols:
             self.conn.execute("ALTER TABLE tasks ADD COLUMN updated_at TEXT NOT NULL DEFAULT '';")
+        if "priority_rank" not in cols:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN priority_rank INTEGER NOT NULL DEFAULT 2;")
+            self.conn.execute(
+                "UPDATE tasks SET priority_rank = CASE priority WHEN 'High' THEN 1 WHEN 'Medium' THEN 2 ELSE 3 END;"
+            )
+        # Index matches the smart-sort ORDER BY so listing is an index scan, not a sort
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_prio_due
+            ON tasks(priority_rank, (due_date IS NULL OR due_date = ''), due_date, created_at);
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_done ON tasks(done);")
+        self.has_fts = self._migrate_fts()
         self.conn.commit()
 
+    def _migrate_fts(self) -> bool:
+        # Full-text index over title/notes; False when SQLite lacks FTS5
+        exists = self.conn.execute("SELECT 1 FROM sqlite_master WHERE name='tasks_fts'").fetchone()
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, notes, content='tasks', content_rowid='id');"
+            )
+        except sqlite3.OperationalError:
+            return False
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tasks_ai AFTER INSERT ON tasks BEGIN
+                INSERT INTO tasks_fts(rowid, title, notes) VALUES (new.id, new.title, new.notes);
+            END;
+        """)
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tasks_ad AFTER DELETE ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, notes) VALUES ('delete', old.id, old.title, old.notes);
+            END;
+        """)
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS tasks_au AFTER UPDATE OF title, notes ON tasks BEGIN
+                INSERT INTO tasks_fts(tasks_fts, rowid, title, notes) VALUES ('delete', old.id, old.title, old.notes);
+                INSERT INTO tasks_fts(rowid, title, notes) VALUES (new.id, new.title, new.notes);
+            END;
+        """)
+        if not exists:
+            # Index tasks written before the FTS table existed
+            self.conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild');")
+        return True
+
+    @contextmanager
+    def transaction(self):
+        # Commits once on success, rolls back on error. The explicit BEGIN makes
+        # reads inside the block part of the transaction too; sqlite3 would
+        # otherwise only open one before the first INSERT/UPDATE/DELETE.
+        with self.conn:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            yield self.conn
+
     # CRUD
     def create(self, title: str, notes: str, priority: str, due_date: str | None) -> int:
         now = iso_now()
-        cur = self.conn.execute(
-            "INSERT INTO tasks(title,notes,priority,due_date,done,created_at,updated_at) VALUES (?,?,?,?,0,?,?)",
-            (title, notes, priority, due_date, now, now),
-        )
-        self.conn.commit()
+        with self.conn:
+            cur = self.conn.execute(SQL_INSERT, (title, notes, priority, PRIORITY_RANK[priority], due_date, now, now))
         return cur.lastrowid
 
+    def create_many(self, rows) -> None:
+        # rows: (title, notes, priority, due_date) tuples, committed as one batch
+        now = iso_now()
+        with self.conn:
+            self.conn.executemany(
+                SQL_INSERT,
+                ((title, notes, priority, PRIORITY_RANK[priority], due_date, now, now)
+                 for title, notes, priority, due_date in rows),
+            )
+
     def update(self, task_id: int, title: str, notes: str, priority: str, due_date: str | None):
         now = iso_now()
-        self.conn.execute(
-            "UPDATE tasks SET title=?, notes=?, priority=?, due_date=?, updated_at=? WHERE id=?",
-            (title, notes, priority, due_date, now, task_id),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(SQL_UPDATE, (title, notes, priority, PRIORITY_RANK[priority], due_date, now, task_id))
 
     def toggle_done(self, task_id: int):
-        self.conn.execute(
-            "UPDATE tasks SET done = CASE done WHEN 1 THEN 0 ELSE 1 END, updated_at=? WHERE id=?",
-            (iso_now(), task_id),
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(SQL_TOGGLE_DONE, (iso_now(), task_id))
+
+    def toggle_done_many(self, task_ids: list[int]):
+        now = iso_now()
+        with self.conn:
+            self.conn.executemany(SQL_TOGGLE_DONE, ((now, tid) for tid in task_ids))
+
+    def delete_many(self, task_ids: list[int]) -> list[Task]:
+        # Snapshot (for undo) and delete in one transaction
+        marks = ",".join("?" * len(task_ids))
+        with self.transaction() as conn:
+            rows = conn.execute(f"{SQL_SELECT} WHERE id IN ({marks}) ORDER BY id", task_ids).fetchall()
+            conn.executemany(SQL_DELETE, ((tid,) for tid in task_ids))
+        return [Task(*r) for r in rows]
 
     def delete(self, task_id: int) -> Task | None:
-        row = self.conn.execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
-        if not row:
-            return None
-        self.conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-        self.conn.commit()
-        return Task(**row)
+        with self.transaction() as conn:
+            row = conn.execute(SQL_GET, (task_id,)).fetchone()
+            if not row:
+                return None
+            conn.execute(SQL_DELETE, (task_id,))
+        return Task(*row)
 
     def get(self, task_id: int) -> Task | None:
-        row = self.conn.execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
-        return Task(**row) if row else None
-
-    def list(self, q: str = "", priority: str = "All", status: str = "All") -> list[Task]:
-        clauses = []
+        row = self.conn.execute(SQL_GET, (task_id,)).fetchone()
+        return Task(*row) if row else None
+
+    def search_ids(self, q: str) -> set[int]:
+        rows = self.conn.execute("SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?", (fts_query(q),))
+        return {r[0] for r in rows}
+
+    def _build_where_shapes(self) -> dict[tuple, str]:
+        # Every filter combination gets one fixed WHERE string, keyed by
+        # (has query, has priority, status), so each shape is a single cached statement
+        search = ("id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)" if self.has_fts
+                  else "(title LIKE ? OR notes LIKE ?)")
+        status_clause = {"All": None, "Pending": "done = 0", "Done": "done = 1"}
+        shapes = {}
+        for has_q in (False, True):
+            for has_priority in (False, True):
+                for status, done_clause in status_clause.items():
+                    clauses = [c for c in (search if has_q else None,
+                                           "priority_rank = ?" if has_priority else None,
+                                           done_clause) if c]
+                    shapes[has_q, has_priority, status] = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        return shapes
+
+    def _filter_args(self, q: str, priority: str, status: str) -> tuple[tuple, list]:
         args: list = []
-        if q:
-            clauses.append("(title LIKE ? OR notes LIKE ?)")
+        if q and self.has_fts:
+            args.append(fts_query(q))
+        elif q:
             like = f"%{q}%"
             args += [like, like]
-        if priority in PRIORITIES:
-            clauses.append("priority = ?")
-            args.append(priority)
-        if status == "Pending":
-            clauses.append("done = 0")
-        elif status == "Done":
-            clauses.append("done = 1")
-        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
-        # Smart order: High->Med->Low, due date NULLs last, then created_at
-        sql = f"""
-        SELECT * FROM tasks
-        {where}
-        ORDER BY 
-          CASE priority WHEN 'High' THEN 1 WHEN 'Medium' THEN 2 ELSE 3 END,
-          CASE WHEN due_date IS NULL OR due_date='' THEN 1 ELSE 0 END,
-          due_date ASC,
-          created_at ASC
-        """
-        rows = self.conn.execute(sql, args).fetchall()
-        return [Task(**r) for r in rows]
+        has_priority = priority in PRIORITIES
+        if has_priority:
+            args.append(PRIORITY_RANK[priority])
+        shape = (bool(q), has_priority, status if status in ("Pending", "Done") else "All")
+        return shape, args
+
+    def list(self, q: str = "", priority: str = "All", status: str = "All") -> list[Task]:
+        shape, args = self._filter_args(q, priority, status)
+        # Plain tuples for the hot path: no sqlite3.Row objects, no keyword dispatch
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        return [Task(*r) for r in cur.execute(self._list_sql[shape], args)]
+
+    def iter_all(self):
+        # Rows stream straight off the cursor; nothing is materialized
+        for row in self.conn.execute(SQL_SELECT + SMART_ORDER):
+            yield row
 
     # Export/Import
     def export_json(self, path: Path):
-        data = [t.__dict__ for t in self.list()]
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Written one task at a time, so memory stays flat however many tasks exist
+        with open(path, "wb") as f:
+            f.write(b"[")
+            sep = b"\n  "
+            for row in self.iter_all():
+                f.write(sep + _dump_json(dict(row)).replace(b"\n", b"\n  "))
+                sep = b",\n  "
+            f.write(b"\n]\n")
 
     def import_json(self, path: Path):
-        with open(path, "r", encoding="utf-8") as f:
-            items = json.load(f)
-        for it in items:
-            title = it.get("title") or "(untitled)"
-            notes = it.get("notes", "")
-            priority = it.get("priority", "Medium")
-            if priority not in PRIORITIES:
-                priority = "Medium"
-            due_date = it.get("due_date") or None
-            try:
-                due_date = valid_date_or_none(due_date)
-            except ValueError:
-                due_date = None
-            self.create(title, notes, priority, due_date)
+        items = _json.loads(Path(path).read_bytes())
+        self.create_many(self._normalize_import(it) for it in items)
+
+    @staticmethod
+    def _normalize_import(it: dict) -> tuple:
+        title = it.get("title") or "(untitled)"
+        notes = it.get("notes", "")
+        priority = it.get("priority", "Medium")
+        if priority not in PRIORITIES:
+            priority = "Medium"
+        due_date = it.get("due_date") or None
+        try:
+            due_date = valid_date_or_none(due_date)
+        except ValueError:
+            due_date = None
+        return title, notes, priority, due_date
 
 # ---------- UI helpers ----------
 class TaskDialog(simpledialog.Dialog):
@@ -237,14 +396,30 @@ class App(tk.Tk):
         self.minsize(780, 480)
 
         self.repo = TaskRepo(DB_PATH)
-        self.deleted_stack: list[Task] = []
+        # Each entry is one delete action (one or more tasks), undone together
+        self.deleted_stack: list[list[Task]] = []
+        # Every task in smart order; reloaded only after writes, filtered in memory
+        self._all_tasks: list[Task] = []
+        self._pending_all = 0       # pending count over _all_tasks, refreshed with it
+        self._refresh_job: str | None = None
+        # Mirror of the tree: row order and each row's (values, tags)
+        self._displayed_ids: list[str] = []
+        self._row_cache: dict[str, tuple] = {}
+        # Virtual scrolling: the tree only holds rows _top.._top+_page_rows of _filtered
+        self._filtered: list[Task] = []
+        self._top = 0
+        self._page_rows = 20
+        # Selected ids, including rows currently scrolled out of the tree
+        self._selected: set[str] = set()
 
         self._build_style()
         self._build_toolbar()
         self._build_table()
         self._build_statusbar()
         self._bind_shortcuts()
-        self.refresh()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.after(OPTIMIZE_INTERVAL_MS, self._pragma_optimize)
+        self.refresh(reload=True)
 
     # UI construction
     def _build_style(self):
@@ -252,7 +427,7 @@ class App(tk.Tk):
         # Use system theme where possible
         theme = "vista" if "vista" in style.theme_names() else ("clam" if "clam" in style.theme_names() else style.theme_use())
         style.theme_use(theme)
-        style.configure("Treeview", rowheight=26)
+        style.configure("Treeview", rowheight=ROW_HEIGHT)
         style.configure("TButton", padding=6)
         style.configure("TEntry", padding=4)
 
@@ -265,7 +440,7 @@ class App(tk.Tk):
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(bar, textvariable=self.search_var, width=28)
         self.search_entry.pack(side="left", padx=(6, 12))
-        self.search_var.trace_add("write", lambda *_: self.refresh())
+        self.search_var.trace_add("write", self._schedule_refresh)
 
         # Priority filter
         ttk.Label(bar, text="Priority").pack(side="left")
@@ -297,7 +472,7 @@ class App(tk.Tk):
         container.pack(fill="both", expand=True)
 
         cols = ("title", "priority", "due_date", "done", "updated_at")
-        self.tree = ttk.Treeview(container, columns=cols, show="headings", selectmode="browse")
+        self.tree = ttk.Treeview(container, columns=cols, show="headings", selectmode="extended")
         self.tree.heading("title", text="Task")
         self.tree.heading("priority", text="Priority")
         self.tree.heading("due_date", text="Due")
@@ -310,9 +485,10 @@ class App(tk.Tk):
         self.tree.column("done", width=90, anchor="center")
         self.tree.column("updated_at", width=160, anchor="center")
 
-        vsb = ttk.Scrollbar(container, orient="vertical", command=self.tree.yview)
+        # The vertical scrollbar drives the virtual window, not the tree itself
+        self.vsb = vsb = ttk.Scrollbar(container, orient="vertical", command=self._yview)
         hsb = ttk.Scrollbar(container, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
@@ -320,6 +496,12 @@ class App(tk.Tk):
         container.rowconfigure(0, weight=1)
         container.columnconfigure(0, weight=1)
 
+        # Row colors by priority; done rows are dimmed on top
+        self.tree.tag_configure("p_high", foreground="#c62828")
+        self.tree.tag_configure("p_med", foreground="#6a1b9a")
+        self.tree.tag_configure("p_low", foreground="#2e7d32")
+        self.tree.tag_configure("done_dim", foreground="#777777")
+
         # Context menu
         self.menu = tk.Menu(self, tearoff=0)
         self.menu.add_command(label="New", command=self.on_new)
@@ -332,6 +514,16 @@ class App(tk.Tk):
         self.tree.bind("<Button-3>", self._popup)
         self.tree.bind("<Double-1>", lambda e: self.on_edit())
 
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self._merge_selection())
+        self.tree.bind("<ButtonPress-1>", self._on_click, add="+")
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_wheel)
+        self.tree.bind("<Up>", lambda e: self._on_arrow(e, -1))
+        self.tree.bind("<Down>", lambda e: self._on_arrow(e, 1))
+        self.tree.bind("<Prior>", lambda e: self._yview("scroll", -1, "pages") or "break")
+        self.tree.bind("<Next>", lambda e: self._yview("scroll", 1, "pages") or "break")
+
     def _build_statusbar(self):
         self.status = tk.StringVar(value="Ready.")
         bar = ttk.Frame(self, relief="sunken")
@@ -352,9 +544,13 @@ class App(tk.Tk):
 
     # Actions
     def selected_id(self) -> int | None:
-        sel = self.tree.selection()
+        sel = self.tree.selection() or tuple(self._selected)
         return int(sel[0]) if sel else None
 
+    def selected_ids(self) -> list[int]:
+        self._merge_selection()
+        return [int(i) for i in self._selected]
+
     def on_new(self):
         dlg = TaskDialog(self, "New Task")
         if not dlg.result:
@@ -367,7 +563,7 @@ class App(tk.Tk):
             return
         new_id = self.repo.create(data["title"], data["notes"], data["priority"], due)
         self.status.set(f"Created task #{new_id}.")
-        self.refresh(select_id=new_id)
+        self.refresh(select_id=new_id, reload=True)
 
     def on_edit(self):
         tid = self.selected_id()
@@ -388,41 +584,55 @@ class App(tk.Tk):
             return
         self.repo.update(tid, data["title"], data["notes"], data["priority"], due)
         self.status.set(f"Updated task #{tid}.")
-        self.refresh(select_id=tid)
+        self.refresh(select_id=tid, reload=True)
 
     def on_toggle(self):
-        tid = self.selected_id()
-        if not tid:
+        ids = self.selected_ids()
+        if not ids:
             messagebox.showinfo("Toggle Done", "Select a task to toggle status.")
             return
-        self.repo.toggle_done(tid)
-        t = self.repo.get(tid)
-        state = "Done" if (t and t.done) else "Pending"
-        self.status.set(f"Toggled task #{tid} → {state}.")
-        self.refresh(select_id=tid)
+        if len(ids) == 1:
+            tid = ids[0]
+            self.repo.toggle_done(tid)
+            t = self.repo.get(tid)
+            state = "Done" if (t and t.done) else "Pending"
+            self.status.set(f"Toggled task #{tid} → {state}.")
+            self.refresh(select_id=tid, reload=True)
+            return
+        self.repo.toggle_done_many(ids)
+        self.status.set(f"Toggled {len(ids)} tasks.")
+        self.refresh(reload=True)
 
     def on_delete(self):
-        tid = self.selected_id()
-        if not tid:
+        ids = self.selected_ids()
+        if not ids:
             messagebox.showinfo("Delete", "Select a task to delete.")
             return
-        if not messagebox.askyesno("Confirm", "Delete selected task?"):
+        prompt = "Delete selected task?" if len(ids) == 1 else f"Delete {len(ids)} selected tasks?"
+        if not messagebox.askyesno("Confirm", prompt):
             return
-        snapshot = self.repo.delete(tid)
-        if snapshot:
-            self.deleted_stack.append(snapshot)
-        self.status.set(f"Deleted task #{tid}. You can Undo.")
-        self.refresh()
+        snapshots = self.repo.delete_many(ids)
+        if snapshots:
+            self.deleted_stack.append(snapshots)
+        what = f"task #{ids[0]}" if len(ids) == 1 else f"{len(ids)} tasks"
+        self.status.set(f"Deleted {what}. You can Undo.")
+        self.refresh(reload=True)
 
     def on_undo(self):
         if not self.deleted_stack:
             messagebox.showinfo("Undo", "Nothing to undo.")
             return
-        t = self.deleted_stack.pop()
-        # Recreate (as new id)
-        new_id = self.repo.create(t.title, t.notes, t.priority, t.due_date)
-        self.status.set(f"Restored task as #{new_id}.")
-        self.refresh(select_id=new_id)
+        tasks = self.deleted_stack.pop()
+        # Recreate (as new ids)
+        if len(tasks) == 1:
+            t = tasks[0]
+            new_id = self.repo.create(t.title, t.notes, t.priority, t.due_date)
+            self.status.set(f"Restored task as #{new_id}.")
+            self.refresh(select_id=new_id, reload=True)
+            return
+        self.repo.create_many((t.title, t.notes, t.priority, t.due_date) for t in tasks)
+        self.status.set(f"Restored {len(tasks)} tasks.")
+        self.refresh(reload=True)
 
     def on_export(self):
         path = filedialog.asksaveasfilename(
@@ -445,59 +655,201 @@ class App(tk.Tk):
             return
         self.repo.import_json(Path(path))
         self.status.set(f"Imported tasks from {path}.")
-        self.refresh()
+        self.refresh(reload=True)
+
+    def _pragma_optimize(self):
+        self.repo.optimize()
+        self.after(OPTIMIZE_INTERVAL_MS, self._pragma_optimize)
+
+    def on_close(self):
+        self.repo.close()
+        self.destroy()
 
     def _popup(self, event):
         try:
             row = self.tree.identify_row(event.y)
-            if row:
+            if row and row not in self.tree.selection():
+                self._selected.clear()
                 self.tree.selection_set(row)
             self.menu.tk_popup(event.x_root, event.y_root)
         finally:
             self.menu.grab_release()
 
     # Refresh & paint
-    def refresh(self, select_id: int | None = None):
+    def _schedule_refresh(self, *_):
+        # Debounce typing: only the last keystroke within 150 ms refreshes
+        if self._refresh_job:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(150, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self):
+        self._refresh_job = None
+        self.refresh()
+
+    def _filter_tasks(self, q: str, priority: str, status: str) -> list[Task]:
+        # Same predicates as TaskRepo.list, applied to the cached task list
+        tasks = self._all_tasks
+        if q and self.repo.has_fts:
+            ids = self.repo.search_ids(q)
+            tasks = [t for t in tasks if t.id in ids]
+        elif q:
+            ql = q.lower()
+            tasks = [t for t in tasks if ql in t.title.lower() or ql in t.notes.lower()]
+        if priority in PRIORITIES:
+            tasks = [t for t in tasks if t.priority == priority]
+        if status == "Pending":
+            tasks = [t for t in tasks if not t.done]
+        elif status == "Done":
+            tasks = [t for t in tasks if t.done]
+        return tasks
+
+    @staticmethod
+    def _row(t: Task) -> tuple:
+        done_label = "✔ Done" if t.done else "⏳ Pending"
+        tag = "p_high" if t.priority == "High" else "p_med" if t.priority == "Medium" else "p_low"
+        values = (t.title, t.priority, t.due_date or "-", done_label, t.updated_at)
+        return values, (tag, "done_dim") if t.done else (tag,)
+
+    # Virtual scrolling
+    def _merge_selection(self):
+        # The tree knows the selection of rows in view; keep ours for the rest
+        self._selected.difference_update(self._displayed_ids)
+        self._selected.update(self.tree.selection())
+
+    def _materialize_visible(self):
+        # Callers merge the tree's selection first; merging here would pull back
+        # rows that are selected in the tree but about to be filtered out
+        total = len(self._filtered)
+        self._top = max(0, min(self._top, total - self._page_rows))
+        window = self._filtered[self._top:self._top + self._page_rows]
+        self._sync_tree(window)
+        in_view = [iid for iid in self._displayed_ids if iid in self._selected]
+        if set(self.tree.selection()) != set(in_view):
+            self.tree.selection_set(in_view)
+        if total:
+            self.vsb.set(self._top / total, (self._top + len(window)) / total)
+        else:
+            self.vsb.set(0, 1)
+
+    def _yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._filtered))
+        elif args[0] == "scroll":
+            step = self._page_rows if args[2] == "pages" else 1
+            self._top += int(args[1]) * step
+        self._merge_selection()
+        self._materialize_visible()
+
+    def _on_tree_configure(self, event):
+        rows = max(1, event.height // ROW_HEIGHT - 1)   # one row's worth for the heading
+        if rows != self._page_rows:
+            self._page_rows = rows
+            self._merge_selection()
+            self._materialize_visible()
+
+    def _on_wheel(self, event):
+        if event.state & 0x0001:            # Shift+wheel: let Treeview scroll sideways
+            return None
+        if event.num == 4 or event.delta > 0:
+            self._yview("scroll", -3, "units")
+        else:
+            self._yview("scroll", 3, "units")
+        return "break"
+
+    def _on_click(self, event):
+        # A plain click on a row replaces the selection, including rows scrolled
+        # out of view; headings, separators and empty space leave it alone
+        if event.state & 0x0005:            # Shift / Control
+            return
+        if self.tree.identify_region(event.x, event.y) in ("cell", "tree"):
+            self._selected.clear()
+
+    def _on_arrow(self, event, step: int):
+        if not event.state & 0x0001:        # plain arrows replace the selection
+            self._selected.clear()
+        ids = self._displayed_ids
+        edge = ids[0 if step < 0 else -1] if ids else None
+        if self.tree.focus() != edge:
+            return None                     # Treeview moves within the window
+        top = self._top
+        self._yview("scroll", step, "units")
+        if self._top == top:
+            return "break"
+        target = self._displayed_ids[0 if step < 0 else -1]
+        self.tree.focus(target)
+        if event.state & 0x0001:
+            self.tree.selection_add(target)
+        else:
+            self.tree.selection_set(target)
+        return "break"
+
+    def _scroll_into_view(self, index: int):
+        if not self._top <= index < self._top + self._page_rows:
+            self._top = max(0, index - self._page_rows // 2)
+
+    def _sync_tree(self, tasks: list[Task]):
+        # Diff against what is shown: touch only rows that appeared, left, changed or moved
+        new_ids = [str(t.id) for t in tasks]
+        new_set = set(new_ids)
+        gone = [iid for iid in self._displayed_ids if iid not in new_set]
+        if gone:
+            self.tree.delete(*gone)
+            for iid in gone:
+                del self._row_cache[iid]
+        kept = [iid for iid in self._displayed_ids if iid in new_set]
+        reorder = kept != [iid for iid in new_ids if iid in self._row_cache]
+
+        # Raw Tcl insert: skips Treeview.insert's per-call option formatting
+        tcl_call = self.tree.tk.call
+        tree_path = str(self.tree)
+        for index, (iid, t) in enumerate(zip(new_ids, tasks)):
+            row = self._row(t)
+            old = self._row_cache.get(iid)
+            if old is None:
+                tcl_call(tree_path, "insert", "", index, "-id", iid, "-values", row[0], "-tags", row[1])
+            else:
+                if old != row:
+                    self.tree.item(iid, values=row[0], tags=row[1])
+                if reorder:
+                    self.tree.move(iid, "", index)
+            self._row_cache[iid] = row
+        self._displayed_ids = new_ids
+
+    def refresh(self, select_id: int | None = None, reload: bool = False):
         q = self.search_var.get().strip()
         pf = self.priority_filter.get()
         sf = self.status_filter.get()
 
-        tasks = self.repo.list(q=q, priority=pf, status=sf)
-
-        # Clear
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
-
-        # Insert with colored tags
-        for t in tasks:
-            done_label = "✔ Done" if t.done else "⏳ Pending"
-            iid = str(t.id)
-            self.tree.insert("", "end", iid=iid, values=(t.title, t.priority, t.due_date or "-", done_label, t.updated_at))
-            # Color by priority & strike-through effect for done
-            if t.priority == "High":
-                self.tree.tag_configure("p_high", foreground="#c62828")
-                self.tree.item(iid, tags=("p_high",))
-            elif t.priority == "Medium":
-                self.tree.tag_configure("p_med", foreground="#6a1b9a")
-                self.tree.item(iid, tags=("p_med",))
-            else:
-                self.tree.tag_configure("p_low", foreground="#2e7d32")
-                self.tree.item(iid, tags=("p_low",))
-            if t.done:
-                # soften text to indicate completion
-                self.tree.tag_configure("done_dim", foreground="#777777")
-                tags = list(self.tree.item(iid, "tags"))
-                tags.append("done_dim")
-                self.tree.item(iid, tags=tuple(tags))
+        if reload:
+            self._all_tasks = self.repo.list()
+            # Counted once per reload so unfiltered refreshes can skip the pass
+            self._pending_all = sum(1 for t in self._all_tasks if not t.done)
+        tasks = self._filter_tasks(q, pf, sf)
+        self._filtered = tasks
 
+        self._merge_selection()
         if select_id:
-            sid = str(select_id)
-            if sid in self.tree.get_children(""):
-                self.tree.selection_set(sid)
-                self.tree.see(sid)
+            index = next((i for i, t in enumerate(tasks) if t.id == select_id), None)
+            if index is not None:
+                self._selected = {str(select_id)}
+                self._scroll_into_view(index)
+        self._materialize_visible()
+        # Selection can only cover tasks that passed the filters
+        self._selected.intersection_update(str(t.id) for t in tasks)
+        if select_id and str(select_id) in self._selected:
+            self.tree.focus(str(select_id))
 
         total = len(tasks)
-        pending = sum(1 for t in tasks if not t.done)
+        # Derive the pending count without a pass when the filters allow it
+        if sf == "Pending":
+            pending = total
+        elif sf == "Done":
+            pending = 0
+        elif not q and pf not in PRIORITIES:
+            pending = self._pending_all
+        else:
+            pending = sum(1 for t in tasks if not t.done)
         self.status.set(f"{total} shown | {pending} pending | Filters: Priority={pf}, Status={sf}")
 
 # ---------- Entry point ----------